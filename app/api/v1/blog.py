@@ -1,5 +1,6 @@
 from typing import List
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, Request, Response
+from pydantic import TypeAdapter
 from app.schemas.responses import ApiResponse
 from app.schemas.blog import (
     BlogViewResponse,
@@ -12,92 +13,98 @@ from app.services.blog_service import blog_service
 
 router = APIRouter()
 
+# Built once so list responses serialize straight to JSON bytes in pydantic-core
+MultipleAnalyticsApiResponse = ApiResponse[List[BlogMultipleAnalyticsResponse]]
+_MULTI_ADAPTER = TypeAdapter(MultipleAnalyticsApiResponse)
 
-@router.post("/blog/analytics/{slug}/view", response_model=ApiResponse[BlogViewResponse])
+
+@router.post(
+    "/blog/analytics/{slug}/view",
+    responses={200: {"model": ApiResponse[BlogViewResponse]}}
+)
 async def increment_blog_view(slug: str, request: Request):
     """Increment blog view count (simplified endpoint)."""
-    try:
-        # Extract headers
-        session_id = request.headers.get("X-Session-ID")
-        user_agent = request.headers.get("X-User-Agent")
-        referrer = request.headers.get("X-Referrer")
-
-        result = await blog_service.increment_blog_view(
-            slug=slug,
-            session_id=session_id,
-            user_agent=user_agent,
-            referrer=referrer
-        )
-
-        return ApiResponse(
-            success=True,
-            data=result
-        )
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
-
-
-@router.get("/blog/analytics/{slug}", response_model=ApiResponse[BlogAnalyticsResponse])
+    # Extract headers
+    session_id = request.headers.get("X-Session-ID")
+    user_agent = request.headers.get("X-User-Agent")
+    referrer = request.headers.get("X-Referrer")
+
+    result = await blog_service.increment_blog_view(
+        slug=slug,
+        session_id=session_id,
+        user_agent=user_agent,
+        referrer=referrer
+    )
+
+    return ApiResponse(
+        success=True,
+        data=result
+    )
+
+
+@router.get(
+    "/blog/analytics/{slug}",
+    responses={200: {"model": ApiResponse[BlogAnalyticsResponse]}}
+)
 async def get_blog_analytics(slug: str):
     """Get analytics for specific blog post."""
-    try:
-        result = await blog_service.get_blog_analytics(slug)
-        return ApiResponse(
-            success=True,
-            data=result
-        )
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    result = await blog_service.get_blog_analytics(slug)
+    return ApiResponse(
+        success=True,
+        data=result
+    )
 
 
-@router.post("/blog/analytics/multiple", response_model=ApiResponse[List[BlogMultipleAnalyticsResponse]])
+@router.post(
+    "/blog/analytics/multiple",
+    responses={200: {"model": MultipleAnalyticsApiResponse}}
+)
 async def get_multiple_blog_analytics(request: BlogMultipleAnalyticsRequest):
     """Get analytics for multiple blog posts."""
-    try:
-        result = await blog_service.get_multiple_blog_analytics(request.slugs)
-        return ApiResponse(
-            success=True,
-            data=result
-        )
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    result = await blog_service.get_multiple_blog_analytics(request.slugs)
+    response = MultipleAnalyticsApiResponse(success=True, data=result)
+    return Response(
+        content=_MULTI_ADAPTER.dump_json(response),
+        media_type="application/json"
+    )
 
 
-@router.get("/blog/analytics/stats", response_model=ApiResponse[BlogStatsResponse])
+@router.get(
+    "/blog/analytics/stats",
+    responses={200: {"model": ApiResponse[BlogStatsResponse]}}
+)
 async def get_blog_stats():
     """Get overall blog analytics."""
-    try:
-        result = await blog_service.get_blog_stats()
-        return ApiResponse(
-            success=True,
-            data=result
-        )
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    result = await blog_service.get_blog_stats()
+    return ApiResponse(
+        success=True,
+        data=result
+    )
 
 
-@router.get("/blog/views/{slug}", response_model=ApiResponse[BlogAnalyticsResponse])
+@router.get(
+    "/blog/views/{slug}",
+    responses={200: {"model": ApiResponse[BlogAnalyticsResponse]}}
+)
 async def get_blog_views(slug: str):
     """Get view count for specific blog post (alias for analytics endpoint)."""
-    try:
-        result = await blog_service.get_blog_analytics(slug)
-        return ApiResponse(
-            success=True,
-            data={"data": result}
-        )
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    result = await blog_service.get_blog_analytics(slug)
+    return ApiResponse(
+        success=True,
+        data=result
+    )
 
 
-@router.get("/blog/views", response_model=ApiResponse[List[BlogMultipleAnalyticsResponse]])
+@router.get("/blog/views", responses={200: {"model": MultipleAnalyticsApiResponse}})
 async def get_multiple_blog_views(slugs: str):
     """Get view counts for multiple blog posts (alias for analytics endpoint)."""
-    try:
-        slug_list = [s.strip() for s in slugs.split(',') if s.strip()]
-        result = await blog_service.get_multiple_blog_analytics(slug_list)
-        return ApiResponse(
-            success=True,
-            data=result
-        )
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+    # Deduplicate while keeping the requested order, widgets often repeat slugs
+    slug_list = list(dict.fromkeys(
+        s for s in (t.strip() for t in slugs.split(',')) if s
+    ))
+    result = await blog_service.get_multiple_blog_analytics(slug_list)
+    response = MultipleAnalyticsApiResponse(success=True, data=result)
+    return Response(
+        content=_MULTI_ADAPTER.dump_json(response),
+        media_type="application/json"
+    )
\ No newline at end of file
@@ -1,48 +1,51 @@
 from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
 from datetime import datetime, timezone
 from app.core.config import settings
-from app.schemas.responses import HealthResponse, HealthData
+from app.schemas.health import HealthResponse
 
 router = APIRouter()
 
+# Settings don't change at runtime, so only the timestamp is filled in per request
+_HEALTH_TEMPLATE = {
+    "status": "healthy",
+    "version": "1.0.0",
+    "environment": settings.ENVIRONMENT
+}
+
+_DETAILED_HEALTH_TEMPLATE = {
+    **_HEALTH_TEMPLATE,
+    "features": {
+        "analytics": settings.ENABLE_ANALYTICS,
+        "feedback": settings.ENABLE_FEEDBACK,
+        "production_only_views": settings.INCREMENT_VIEWS_ONLY_IN_PRODUCTION
+    }
+}
+
 
-@router.get("/health", response_model=HealthResponse)
+@router.get("/health", responses={200: {"model": HealthResponse}})
 async def health_check():
     """Basic health check endpoint."""
-
-    health_data = HealthData(
-        status="healthy",
-        timestamp=datetime.now(timezone.utc),
-        version="1.0.0",
-        environment=settings.ENVIRONMENT
-    )
-
-    return HealthResponse(
-        success=True,
-        data=health_data
-    )
+    return ORJSONResponse({
+        "success": True,
+        "data": {
+            **_HEALTH_TEMPLATE,
+            "timestamp": datetime.now(timezone.utc).isoformat()
+        }
+    })
 
 
-@router.get("/health/detailed", response_model=HealthResponse)
+@router.get("/health/detailed")
 async def detailed_health_check():
     """Detailed health check with database status."""
 
     # TODO: Add database connectivity check
     # TODO: Add external service checks
 
-    health_data = {
-        "status": "healthy",
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        "version": "1.0.0",
-        "environment": settings.ENVIRONMENT,
-        "features": {
-            "analytics": settings.ENABLE_ANALYTICS,
-            "feedback": settings.ENABLE_FEEDBACK,
-            "production_only_views": settings.INCREMENT_VIEWS_ONLY_IN_PRODUCTION
+    return ORJSONResponse({
+        "success": True,
+        "data": {
+            **_DETAILED_HEALTH_TEMPLATE,
+            "timestamp": datetime.now(timezone.utc).isoformat()
         }
-    }
-
-    return HealthResponse(
-        success=True,
-        data=health_data
-    )
+    })
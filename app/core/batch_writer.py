@@ -0,0 +1,140 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Queued by stop() so the flusher drains everything put before it
+_STOP = object()
+
+
+class AsyncBatchWriter:
+    """Buffer writes and flush them in batches from a background task.
+
+    A failed flush is retried with exponential backoff. If every attempt fails,
+    the batch is kept and prepended to the next flush, up to max_pending writes,
+    so a short outage of the backing store doesn't lose acknowledged writes.
+    Delivery is at-least-once, a flush that failed after its writes landed is
+    sent again, so flush callbacks should tolerate seeing a batch twice.
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[List[Any]], Awaitable[None]],
+        max_batch_size: int = 500,
+        max_delay: float = 0.05,
+        max_retries: int = 3,
+        retry_delay: float = 0.1,
+        max_pending: int = 10_000
+    ):
+        self._flush = flush
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.max_pending = max_pending
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._pending: List[Any] = []
+        self._stopping = False
+
+    @property
+    def is_running(self) -> bool:
+        """Whether put() accepts items; False once stop() has begun."""
+        return self._task is not None and not self._stopping
+
+    def start(self):
+        """Start the background flush task on the running event loop."""
+        if self._task is None:
+            self._stopping = False
+            self._queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Flush everything still queued and stop the background task."""
+        if self._task is None or self._stopping:
+            return
+        # Callers check is_running and write through from here on
+        self._stopping = True
+        self._queue.put_nowait(_STOP)
+        await self._task
+
+        # Nothing should land behind the sentinel, but never drop it silently
+        while not self._queue.empty():
+            item = self._queue.get_nowait()
+            if item is not _STOP:
+                self._pending.append(item)
+        self._task = None
+        self._queue = None
+
+        # One last try for writes held back by earlier failures
+        if self._pending:
+            await self._write([])
+        if self._pending:
+            logger.error(
+                "Lost %d queued writes that could not be flushed before shutdown",
+                len(self._pending)
+            )
+            self._pending = []
+        self._stopping = False
+
+    def put(self, item: Any):
+        """Queue an item for the next batch."""
+        if not self.is_running:
+            raise RuntimeError("AsyncBatchWriter is not running, write through instead")
+        self._queue.put_nowait(item)
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            item = await self._queue.get()
+            if item is _STOP:
+                break
+
+            # Coalesce whatever arrives within max_delay, up to max_batch_size
+            batch = [item]
+            deadline = loop.time() + self.max_delay
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            await self._write(batch)
+
+    async def _write(self, batch: List[Any]):
+        # Writes held back by an earlier failure go first to keep their order
+        if self._pending:
+            batch = self._pending + batch
+            self._pending = []
+
+        delay = self.retry_delay
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                await self._flush(batch)
+                return
+            except Exception:
+                logger.warning(
+                    "Failed to flush %d queued writes (attempt %d of %d)",
+                    len(batch), attempt, self.max_retries, exc_info=True
+                )
+            if attempt < self.max_retries:
+                await asyncio.sleep(delay)
+                delay *= 2
+
+        # Hold the batch for the next flush, oldest writes past max_pending go first
+        dropped = len(batch) - self.max_pending
+        if dropped > 0:
+            logger.error(
+                "Dropping %d queued writes after repeated flush failures", dropped
+            )
+            batch = batch[dropped:]
+        self._pending = batch
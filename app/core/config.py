@@ -1,3 +1,6 @@
+from functools import cached_property, lru_cache
+from typing import Optional
+
 from pydantic_settings import BaseSettings
 
 
@@ -8,12 +11,20 @@ class Settings(BaseSettings):
     # Database
     DATABASE_URL: str = "postgresql://localhost:5432/remcostoeten"
 
+    # Redis (shared analytics storage across workers, in-memory when unset)
+    REDIS_URL: Optional[str] = None
+
+    # Analytics read cache (seconds)
+    ANALYTICS_CACHE_TTL: float = 10.0
+
     # Security
     SECRET_KEY: str = "dev-secret-key-change-in-production"
 
     # API
     API_PORT: int = 4001
     API_HOST: str = "0.0.0.0"
+    # Visitor and blog analytics are per-process, only raise this with shared storage
+    API_WORKERS: int = 1
 
     # Feature flags
     ENABLE_ANALYTICS: bool = True
@@ -27,6 +38,12 @@ class Settings(BaseSettings):
         "https://www.remcostoeten.nl",
         "https://api-production-379a.up.railway.app"
     ]
+    # How long browsers may reuse a preflight response (seconds)
+    CORS_MAX_AGE: int = 86400
+
+    @cached_property
+    def allowed_origins_set(self) -> frozenset[str]:
+        return frozenset(self.ALLOWED_ORIGINS)
 
     @property
     def is_production(self) -> bool:
@@ -41,6 +58,7 @@ class Settings(BaseSettings):
         case_sensitive = True
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Get application settings."""
     return Settings()
@@ -0,0 +1,46 @@
+import logging
+
+from fastapi.responses import ORJSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..schemas.responses import ApiError
+
+logger = logging.getLogger(__name__)
+
+
+class UnhandledErrorMiddleware:
+    """Turn unexpected errors into the standard API error response.
+
+    Exception handlers registered on the app run in ServerErrorMiddleware,
+    outside CORSMiddleware, so their responses carry no CORS headers. Add this
+    middleware before CORSMiddleware so CORS wraps the error response too.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message: Message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as exc:
+            # Too late to replace a response that is already on the wire
+            if response_started:
+                raise
+            logger.exception("Unhandled error on %s %s", scope["method"], scope["path"])
+            error = ApiError(error=str(exc), code="internal_error")
+            response = ORJSONResponse(
+                status_code=500, content=error.model_dump(mode="json")
+            )
+            await response(scope, receive, send)
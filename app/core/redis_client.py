@@ -0,0 +1,31 @@
+from .config import settings
+
+# Global Redis client, created lazily when REDIS_URL is configured
+redis_client = None
+
+
+def get_redis():
+    """Get the shared Redis client, or None when Redis is not configured."""
+    global redis_client
+    if redis_client is None and settings.REDIS_URL:
+        from redis.asyncio import Redis
+
+        redis_client = Redis.from_url(settings.REDIS_URL, decode_responses=True)
+    return redis_client
+
+
+async def connect_to_redis():
+    """Connect to Redis."""
+    client = get_redis()
+    if client is not None:
+        await client.ping()
+        print("✅ Connected to Redis")
+
+
+async def disconnect_from_redis():
+    """Disconnect from Redis."""
+    global redis_client
+    if redis_client is not None:
+        await redis_client.aclose()
+        redis_client = None
+        print("✅ Disconnected from Redis")
@@ -1,10 +1,15 @@
-from fastapi import FastAPI
+from fastapi import APIRouter, FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
+import orjson
 
 from .core.config import settings
+from .core.redis_client import connect_to_redis, disconnect_from_redis
+from .core.errors import UnhandledErrorMiddleware
 # from .core.database import connect_to_database, disconnect_from_database
 from .api.v1 import health_router, visitors_router, pageviews_router, blog_router
+from .services.pageview_service import pageview_service
 
 
 @asynccontextmanager
@@ -13,6 +18,10 @@ async def lifespan(app: FastAPI):
     # Startup
     print(f"🚀 Starting API in {settings.ENVIRONMENT} mode")
 
+    if settings.REDIS_URL:
+        await connect_to_redis()
+        pageview_service.writer.start()
+
     # TODO: Connect to database when implemented
     # if settings.ENABLE_ANALYTICS:
     #     await connect_to_database()
@@ -21,6 +30,10 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     print("🛑 Shutting down API")
+    if settings.REDIS_URL:
+        await pageview_service.writer.stop()
+    await disconnect_from_redis()
+
     # TODO: Disconnect from database when implemented
     # if settings.ENABLE_ANALYTICS:
     #     await disconnect_from_database()
@@ -33,54 +46,67 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs" if settings.is_development else None,
     redoc_url="/redoc" if settings.is_development else None,
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
+# Unexpected errors become ApiError responses inside CORS, so they keep CORS headers
+app.add_middleware(UnhandledErrorMiddleware)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.ALLOWED_ORIGINS,
+    allow_origins=settings.allowed_origins_set,
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
     allow_headers=["*"],
+    max_age=settings.CORS_MAX_AGE,
 )
 
 
-# Include routers
-app.include_router(health_router, prefix="/api/v1", tags=["Health"])
-app.include_router(visitors_router, prefix="/api/v1", tags=["Visitors"])
-app.include_router(pageviews_router, prefix="/api/v1", tags=["Pageviews"])
-app.include_router(blog_router, prefix="/api/v1", tags=["Blog"])
+# Include routers under one /api/v1 prefix
+api_v1_router = APIRouter(prefix="/api/v1")
+api_v1_router.include_router(health_router, tags=["Health"])
+api_v1_router.include_router(visitors_router, tags=["Visitors"])
+api_v1_router.include_router(pageviews_router, tags=["Pageviews"])
+api_v1_router.include_router(blog_router, tags=["Blog"])
+app.include_router(api_v1_router)
+
+
+# Settings don't change at runtime, so the info payloads are serialized once
+_ROOT_BYTES = orjson.dumps({
+    "message": "Remco Stoeten API",
+    "version": "1.0.0",
+    "environment": settings.ENVIRONMENT,
+    "docs": "/docs" if settings.is_development else "disabled in production"
+})
+
+_API_INFO_BYTES = orjson.dumps({
+    "name": "Remco Stoeten API",
+    "version": "1.0.0",
+    "environment": settings.ENVIRONMENT,
+    "features": {
+        "analytics": settings.ENABLE_ANALYTICS,
+        "feedback": settings.ENABLE_FEEDBACK,
+        "production_only_views": settings.INCREMENT_VIEWS_ONLY_IN_PRODUCTION
+    },
+    "endpoints": {
+        "health": "/api/v1/health",
+        "docs": "/docs" if settings.is_development else "disabled"
+    }
+})
 
 
 @app.get("/")
 async def root():
     """Root endpoint."""
-    return {
-        "message": "Remco Stoeten API",
-        "version": "1.0.0",
-        "environment": settings.ENVIRONMENT,
-        "docs": "/docs" if settings.is_development else "disabled in production"
-    }
+    return Response(content=_ROOT_BYTES, media_type="application/json")
 
 
 @app.get("/api")
 async def api_info():
     """API information endpoint."""
-    return {
-        "name": "Remco Stoeten API",
-        "version": "1.0.0",
-        "environment": settings.ENVIRONMENT,
-        "features": {
-            "analytics": settings.ENABLE_ANALYTICS,
-            "feedback": settings.ENABLE_FEEDBACK,
-            "production_only_views": settings.INCREMENT_VIEWS_ONLY_IN_PRODUCTION
-        },
-        "endpoints": {
-            "health": "/api/v1/health",
-            "docs": "/docs" if settings.is_development else "disabled"
-        }
-    }
+    return Response(content=_API_INFO_BYTES, media_type="application/json")
 
 
 if __name__ == "__main__":
@@ -90,5 +116,8 @@ if __name__ == "__main__":
         host=settings.API_HOST,
         port=settings.API_PORT,
         reload=settings.is_development,
+        workers=1 if settings.is_development else settings.API_WORKERS,
+        loop="uvloop",
+        http="httptools",
         log_level="info"
     )
@@ -1,11 +1,7 @@
 from pydantic import BaseModel, ConfigDict
 from datetime import datetime
 
-
-class HealthResponse(BaseModel):
-    """Health check response."""
-    success: bool
-    data: dict
+from .responses import ApiResponse
 
 
 class HealthData(BaseModel):
@@ -19,3 +15,8 @@ class HealthData(BaseModel):
     timestamp: datetime
     version: str
     environment: str
+
+
+class HealthResponse(ApiResponse[HealthData]):
+    """Health check response."""
+    pass
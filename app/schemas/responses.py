@@ -11,7 +11,9 @@ class ApiResponse(BaseModel, Generic[DataType]):
     data: Optional[DataType] = Field(None, description="Response data")
     error: Optional[str] = Field(None, description="Error message if success is false")
     message: Optional[str] = Field(None, description="Optional message")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Response timestamp")
+    timestamp: Optional[datetime] = Field(
+        None, description="Response timestamp, set explicitly where needed"
+    )
 
 
 class ApiError(BaseModel):
@@ -32,17 +34,3 @@ class SuccessResponse(ApiResponse[dict]):
 class EmptySuccessResponse(ApiResponse[None]):
     """Success response with no data."""
     pass
-
-
-# Health check specific responses
-class HealthData(BaseModel):
-    """Health check data."""
-    status: str
-    timestamp: datetime
-    version: str
-    environment: str
-
-
-class HealthResponse(ApiResponse[HealthData]):
-    """Health check response."""
-    pass
\ No newline at end of file
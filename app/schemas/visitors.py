@@ -36,6 +36,7 @@ class VisitorBlogViewResponse(BaseModel):
     view_id: str = Field(..., description="Unique view identifier")
     is_new_view: bool = Field(..., description="Whether this is a new view")
     total_blog_views: int = Field(..., description="Total blog views")
+    unique_blog_views: int = Field(..., description="Unique blog views")
 
 
 class VisitorStatsResponse(BaseModel):
@@ -1,5 +1,5 @@
 from typing import List, Dict, Optional
-from datetime import datetime, timezone, timedelta
+from datetime import date, datetime, timezone
 from uuid import uuid4
 
 from ..schemas.blog import (
@@ -10,6 +10,9 @@ from ..schemas.blog import (
 )
 from ..services.visitor_service import visitor_service
 
+# Last 30 days, oldest first
+_DAILY_VIEW_OFFSETS = range(29, -1, -1)
+
 
 class MemoryBlogService:
     """In-memory blog analytics service for development."""
@@ -31,9 +34,6 @@ class MemoryBlogService:
             # This is a simplified approach - in production, we'd have proper session management
             pass
 
-        # Get current views for this blog
-        current_data = await visitor_service.get_blog_views(slug)
-
         # Create a simple blog view entry through visitor service
         # In a real implementation, this would be more sophisticated
         visitor_id = "anonymous"  # Simplified for now
@@ -45,33 +45,32 @@ class MemoryBlogService:
             blog_title=f"Blog post: {slug}"  # Simplified
         )
 
-        view_result = await visitor_service.track_blog_view(view_request)
-
-        # Get updated stats
-        updated_data = await visitor_service.get_blog_views(slug)
+        # The tracking result already carries the updated totals
+        view_result = visitor_service.track_blog_view(view_request)
 
         return BlogViewResponse(
             slug=slug,
-            total_views=updated_data.total_views,
-            unique_views=updated_data.unique_views,
+            total_views=view_result.total_blog_views,
+            unique_views=view_result.unique_blog_views,
             is_new_view=view_result.is_new_view
         )
 
     async def get_blog_analytics(self, slug: str) -> BlogAnalyticsResponse:
         """Get analytics for specific blog post."""
-        views_data = await visitor_service.get_blog_views(slug)
+        views_data = visitor_service.get_blog_views(slug)
 
         # Generate some sample daily views data
-        daily_views = []
-        now = datetime.now(timezone.utc)
-        for i in range(30):  # Last 30 days
-            date = (now - timedelta(days=i)).date()
-            # Simplified: just use some sample data
-            daily_views.append({
-                "date": date.isoformat(),
-                "views": max(0, views_data.total_views - i * 2),
-                "uniqueViews": max(0, views_data.unique_views - i)
-            })
+        today = datetime.now(timezone.utc).date().toordinal()
+        total_views = views_data.total_views
+        unique_views = views_data.unique_views
+        daily_views = [
+            {
+                "date": date.fromordinal(today - i).isoformat(),
+                "views": max(0, total_views - i * 2),
+                "uniqueViews": max(0, unique_views - i)
+            }
+            for i in _DAILY_VIEW_OFFSETS
+        ]
 
         return BlogAnalyticsResponse(
             slug=slug,
@@ -79,35 +78,32 @@ class MemoryBlogService:
             unique_views=views_data.unique_views,
             recent_views=views_data.recent_views,
             last_viewed_at=views_data.last_viewed_at,
-            daily_views=list(reversed(daily_views))  # Most recent first
+            daily_views=daily_views
         )
 
     async def get_multiple_blog_analytics(self, slugs: List[str]) -> List[BlogMultipleAnalyticsResponse]:
         """Get analytics for multiple blog posts."""
-        results = []
-        for slug in slugs:
-            views_data = await visitor_service.get_blog_views(slug)
-            results.append(BlogMultipleAnalyticsResponse(
+        views_by_slug = visitor_service.get_blog_views_bulk(slugs)
+        return [
+            BlogMultipleAnalyticsResponse(
                 slug=slug,
-                total_views=views_data.total_views,
-                unique_views=views_data.unique_views,
-                recent_views=views_data.recent_views
-            ))
-        return results
+                total_views=views_by_slug[slug].total_views,
+                unique_views=views_by_slug[slug].unique_views,
+                recent_views=views_by_slug[slug].recent_views
+            )
+            for slug in slugs
+        ]
 
     async def get_blog_stats(self) -> BlogStatsResponse:
         """Get overall blog analytics."""
-        visitor_stats = await visitor_service.get_visitor_stats()
+        visitor_stats = visitor_service.get_visitor_stats()
 
         # Calculate stats
         total_views = visitor_stats.total_blog_views
         unique_views = visitor_stats.unique_blog_views
 
         # Count unique blog posts
-        unique_slugs = set()
-        for view in visitor_service.blog_views:
-            unique_slugs.add(view["blog_slug"])
-        total_blog_posts = len(unique_slugs)
+        total_blog_posts = len(visitor_service.views_by_slug)
 
         # Calculate average
         average_views = total_views / total_blog_posts if total_blog_posts > 0 else 0
@@ -1,20 +1,172 @@
-from typing import List, Dict
+from typing import List, Dict, Optional
 from datetime import datetime, timezone, timedelta
 from uuid import uuid4
-
+from array import array
+from bisect import bisect_left, insort
+from collections import Counter
+import heapq
+import time
+
+from ..core.batch_writer import AsyncBatchWriter
+from ..core.config import settings
+from ..core.redis_client import get_redis
 from ..schemas.pageviews import (
     PageviewRequest,
     PageviewResponse,
     PageviewStatsResponse
 )
 
+SECONDS_PER_DAY = 86400
+
+
+def _pageview_time(timestamp: Optional[datetime], now: datetime) -> datetime:
+    """Resolve a client timestamp, clamping future ones to now."""
+    if timestamp is None:
+        return now
+    # Naive timestamps are local time, as datetime.timestamp() treats them
+    return min(timestamp.astimezone(timezone.utc), now)
+
 
 class MemoryPageviewService:
     """In-memory pageview tracking service for development."""
 
     def __init__(self):
-        # In-memory storage (will be replaced with database)
-        self.pageviews: List[dict] = []
+        # In-memory columnar storage, one column per field
+        # (will be replaced with database)
+        self.ids: List[str] = []
+        self.urls: List[str] = []
+        self.titles: List[Optional[str]] = []
+        self.referrers: List[Optional[str]] = []
+        self.user_agents: List[Optional[str]] = []
+        self.timestamps = array("d")
+        self.tracked_at = array("d")
+        self.screen_resolutions: List[Optional[str]] = []
+        self.timezones: List[Optional[str]] = []
+        self.platforms: List[Optional[str]] = []
+        self.session_ids: List[Optional[str]] = []
+
+        # Aggregates maintained on write so stats don't rescan pageviews
+        self._url_counts: Counter = Counter()
+        self._url_titles: Dict[str, Optional[str]] = {}
+        # Sorted epoch seconds of pageviews inside the weekly window, packed as float64
+        self._recent_timestamps = array("d")
+
+    def _expire_old(self, week_start: float):
+        """Drop timestamps that fell out of the weekly window."""
+        del self._recent_timestamps[:bisect_left(self._recent_timestamps, week_start)]
+
+    async def track_pageview(
+        self,
+        request: PageviewRequest,
+        screen_resolution: str = None,
+        timezone_str: str = None,
+        platform: str = None,
+        session_id: str = None
+    ) -> PageviewResponse:
+        """Track a page view."""
+        pageview_id = str(uuid4())
+        now = datetime.now(timezone.utc)
+
+        timestamp = _pageview_time(request.timestamp, now).timestamp()
+
+        self.ids.append(pageview_id)
+        self.urls.append(request.url)
+        self.titles.append(request.title)
+        self.referrers.append(request.referrer)
+        self.user_agents.append(request.user_agent)
+        self.timestamps.append(timestamp)
+        self.tracked_at.append(now.timestamp())
+        self.screen_resolutions.append(screen_resolution)
+        self.timezones.append(timezone_str)
+        self.platforms.append(platform)
+        self.session_ids.append(session_id)
+
+        self._url_counts[request.url] += 1
+        self._url_titles.setdefault(request.url, request.title)
+        insort(self._recent_timestamps, timestamp)
+
+        return PageviewResponse(
+            pageview_id=pageview_id,
+            tracked_at=now
+        )
+
+    async def get_pageview_stats(self) -> PageviewStatsResponse:
+        """Get pageview statistics."""
+        # Epoch seconds are UTC-aligned, so whole days start at multiples of a day
+        now = time.time()
+        today_start = now - now % SECONDS_PER_DAY
+        yesterday_start = today_start - SECONDS_PER_DAY
+        week_start = today_start - 7 * SECONDS_PER_DAY
+
+        # Bucket the weekly window with bisects over the sorted timestamps
+        self._expire_old(week_start)
+        timestamps = self._recent_timestamps
+        today_index = bisect_left(timestamps, today_start)
+        yesterday_index = bisect_left(timestamps, yesterday_start)
+
+        total_pageviews = len(self.ids)
+        today_pageviews = len(timestamps) - today_index
+        yesterday_pageviews = today_index - yesterday_index
+        week_pageviews = len(timestamps)
+
+        # Unique URLs
+        unique_urls = len(self._url_counts)
+
+        # Top pages
+        top_pages = [
+            {"url": url, "count": count, "title": self._url_titles[url]}
+            for url, count in self._url_counts.most_common(10)
+        ]
+
+        return PageviewStatsResponse(
+            total=total_pageviews,
+            today=today_pageviews,
+            yesterday=yesterday_pageviews,
+            this_week=week_pageviews,
+            unique_urls=unique_urls,
+            top_pages=top_pages
+        )
+
+
+class RedisPageviewService:
+    """Redis-backed pageview tracking service shared across workers."""
+
+    TOTAL_KEY = "pv:total"
+    URL_COUNT_KEY = "pv:url_count"
+    URL_TITLE_KEY = "pv:url_title"
+    DAY_KEY_PREFIX = "pv:day:"
+    # Daily buckets are only read for the last week, let Redis drop the rest
+    DAY_KEY_TTL = timedelta(days=9)
+
+    def __init__(self):
+        # Pageviews are buffered and written in batches once started in lifespan
+        self.writer = AsyncBatchWriter(self._write_pageviews)
+
+    def _day_key(self, moment: datetime) -> str:
+        day = moment.astimezone(timezone.utc).date()
+        return f"{self.DAY_KEY_PREFIX}{day.isoformat()}"
+
+    async def _write_pageviews(self, pageviews: List[dict]):
+        """Write a batch of pageviews in a single pipelined round-trip.
+
+        The batch runs as one MULTI/EXEC transaction, so a single attempt is
+        applied whole or not at all. Retries are at-least-once: if EXEC commits
+        but its reply is lost, the writer retries and the counters count the
+        batch twice. Only the per-day ZADD by pageview id is idempotent.
+        """
+        pipe = get_redis().pipeline(transaction=True)
+        pipe.incrby(self.TOTAL_KEY, len(pageviews))
+        day_keys = set()
+        for pageview in pageviews:
+            day_key = self._day_key(pageview["timestamp"])
+            day_keys.add(day_key)
+            pipe.hincrby(self.URL_COUNT_KEY, pageview["url"], 1)
+            # Keep the first title seen, even a missing one (stored as ""), like memory
+            pipe.hsetnx(self.URL_TITLE_KEY, pageview["url"], pageview["title"] or "")
+            pipe.zadd(day_key, {pageview["id"]: pageview["timestamp"].timestamp()})
+        for day_key in day_keys:
+            pipe.expire(day_key, self.DAY_KEY_TTL)
+        await pipe.execute()
 
     async def track_pageview(
         self,
@@ -32,17 +184,13 @@ class MemoryPageviewService:
             "id": pageview_id,
             "url": request.url,
             "title": request.title,
-            "referrer": request.referrer,
-            "user_agent": request.user_agent,
-            "timestamp": request.timestamp or now,
-            "tracked_at": now,
-            "screen_resolution": screen_resolution,
-            "timezone": timezone_str,
-            "platform": platform,
-            "session_id": session_id
+            "timestamp": _pageview_time(request.timestamp, now)
         }
 
-        self.pageviews.append(pageview)
+        if self.writer.is_running:
+            self.writer.put(pageview)
+        else:
+            await self._write_pageviews([pageview])
 
         return PageviewResponse(
             pageview_id=pageview_id,
@@ -51,42 +199,40 @@ class MemoryPageviewService:
 
     async def get_pageview_stats(self) -> PageviewStatsResponse:
         """Get pageview statistics."""
+        redis = get_redis()
         now = datetime.now(timezone.utc)
         today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        yesterday_start = today_start - timedelta(days=1)
-        week_start = today_start - timedelta(days=7)
 
-        # Filter pageviews by time periods
-        total_pageviews = len(self.pageviews)
-        today_pageviews = len([p for p in self.pageviews if p["timestamp"] >= today_start])
-        yesterday_pageviews = len([p for p in self.pageviews if yesterday_start <= p["timestamp"] < today_start])
-        week_pageviews = len([p for p in self.pageviews if p["timestamp"] >= week_start])
-
-        # Unique URLs
-        unique_urls = len(set(p["url"] for p in self.pageviews))
+        # Today plus the seven days before it make up the week window
+        pipe = redis.pipeline(transaction=False)
+        pipe.get(self.TOTAL_KEY)
+        pipe.hgetall(self.URL_COUNT_KEY)
+        for days_ago in range(8):
+            pipe.zcard(self._day_key(today_start - timedelta(days=days_ago)))
+        total, url_counts, *day_counts = await pipe.execute()
 
         # Top pages
-        url_counts = {}
-        for pageview in self.pageviews:
-            url = pageview["url"]
-            if url not in url_counts:
-                url_counts[url] = {"count": 0, "title": pageview.get("title", url)}
-            url_counts[url]["count"] += 1
+        top_urls = heapq.nlargest(10, url_counts.items(), key=lambda x: int(x[1]))
+        titles = []
+        if top_urls:
+            titles = await redis.hmget(self.URL_TITLE_KEY, [url for url, _ in top_urls])
 
         top_pages = [
-            {"url": url, "count": data["count"], "title": data["title"]}
-            for url, data in sorted(url_counts.items(), key=lambda x: x[1]["count"], reverse=True)[:10]
+            {"url": url, "count": int(count), "title": title or None}
+            for (url, count), title in zip(top_urls, titles)
         ]
 
         return PageviewStatsResponse(
-            total=total_pageviews,
-            today=today_pageviews,
-            yesterday=yesterday_pageviews,
-            this_week=week_pageviews,
-            unique_urls=unique_urls,
+            total=int(total or 0),
+            today=day_counts[0],
+            yesterday=day_counts[1],
+            this_week=sum(day_counts),
+            unique_urls=len(url_counts),
             top_pages=top_pages
         )
 
 
 # Global service instance
-pageview_service = MemoryPageviewService()
\ No newline at end of file
+pageview_service = (
+    RedisPageviewService() if settings.REDIS_URL else MemoryPageviewService()
+)
\ No newline at end of file
@@ -1,8 +1,14 @@
-from typing import Dict, List, Optional
-from datetime import datetime, timezone
+from typing import Dict, List, Optional, Set
+from dataclasses import dataclass
+from datetime import datetime, timezone, timedelta
 from uuid import uuid4
+from bisect import bisect_right, insort
+from collections import defaultdict
 import hashlib
+import heapq
 
+from ..core.cache import TTLCache
+from ..core.config import settings
 from ..schemas.visitors import (
     VisitorTrackRequest,
     VisitorTrackResponse,
@@ -13,69 +19,175 @@ from ..schemas.visitors import (
 )
 
 
+@dataclass(slots=True)
+class Visitor:
+    """A tracked visitor."""
+    id: str
+    fingerprint: str
+    user_agent: str
+    accept_language: str
+    screen_resolution: str
+    timezone: str
+    platform: str
+    language: str
+    referrer: Optional[str]
+    first_visit_at: datetime
+    last_visit_at: datetime
+    total_visits: int = 1
+    is_new_visitor: bool = True
+
+
+@dataclass(slots=True)
+class BlogView:
+    """A single view of a blog post."""
+    id: str
+    visitor_id: str
+    blog_slug: str
+    blog_title: str
+    viewed_at: datetime
+    is_unique_view: bool
+    is_localhost: bool = False
+
+
 class MemoryVisitorService:
     """In-memory visitor tracking service for development."""
 
     def __init__(self):
         # In-memory storage (will be replaced with database)
-        self.visitors: Dict[str, dict] = {}
-        self.blog_views: List[dict] = []
-        self.visitor_sessions: Dict[str, List[datetime]] = {}
+        self.visitors: Dict[str, Visitor] = {}
+        self.blog_views: List[BlogView] = []
+        self.visitor_sessions: Dict[str, List[datetime]] = defaultdict(list)
+
+        # Indexes maintained on write
+        self.fingerprint_index: Dict[str, str] = {}
+        self.new_visitor_count = 0
+        self.views_by_slug: Dict[str, List[BlogView]] = defaultdict(list)
+        self.unique_viewers_by_slug: Dict[str, Set[str]] = defaultdict(set)
+        self.viewed_at_by_slug: Dict[str, List[datetime]] = defaultdict(list)
+        self.localhost_views_by_slug: Dict[str, int] = defaultdict(int)
+        self.localhost_viewers_by_slug: Dict[str, Set[str]] = defaultdict(set)
+        self.unique_visitors_all: Set[str] = set()
+        self.unique_visitors_localhost: Set[str] = set()
+        self.unique_visitors_production: Set[str] = set()
+        self.first_viewed_at: Optional[datetime] = None
+        self.last_viewed_at: Optional[datetime] = None
+
+        # View IDs only need to be unique within this process
+        self._id_counter = 0
+
+        # Bumped on every write so callers can tell whether their derived data is stale
+        self.version = 0
+
+        # Short-lived read caches, invalidated on every write
+        self._blog_views_cache = TTLCache(ttl=settings.ANALYTICS_CACHE_TTL)
+        self._stats_cache = TTLCache(ttl=settings.ANALYTICS_CACHE_TTL, maxsize=1)
+
+    def rebuild_indexes(self):
+        """Rebuild indexes and drop cached reads after storage was replaced directly."""
+        self.fingerprint_index = {
+            v.fingerprint: visitor_id for visitor_id, v in self.visitors.items()
+        }
+        self.new_visitor_count = sum(
+            1 for v in self.visitors.values() if v.total_visits == 1
+        )
+        self.views_by_slug = defaultdict(list)
+        self.unique_viewers_by_slug = defaultdict(set)
+        self.viewed_at_by_slug = defaultdict(list)
+        self.localhost_views_by_slug = defaultdict(int)
+        self.localhost_viewers_by_slug = defaultdict(set)
+        self.unique_visitors_all = set()
+        self.unique_visitors_localhost = set()
+        self.unique_visitors_production = set()
+        for view in self.blog_views:
+            self.views_by_slug[view.blog_slug].append(view)
+            self.unique_viewers_by_slug[view.blog_slug].add(view.visitor_id)
+            self.viewed_at_by_slug[view.blog_slug].append(view.viewed_at)
+            self._count_visitor(view.visitor_id, view.is_localhost)
+            if view.is_localhost:
+                self._count_localhost_view(view.blog_slug, view.visitor_id)
+        for viewed_at in self.viewed_at_by_slug.values():
+            viewed_at.sort()
+        if self.viewed_at_by_slug:
+            slug_times = self.viewed_at_by_slug.values()
+            self.first_viewed_at = min(viewed_at[0] for viewed_at in slug_times)
+            self.last_viewed_at = max(viewed_at[-1] for viewed_at in slug_times)
+        else:
+            self.first_viewed_at = self.last_viewed_at = None
+        self.version += 1
+        self._blog_views_cache.clear()
+        self._stats_cache.clear()
+
+    def _count_visitor(self, visitor_id: str, is_localhost: bool):
+        """Add a blog viewer to the unique visitor sets."""
+        self.unique_visitors_all.add(visitor_id)
+        if is_localhost:
+            self.unique_visitors_localhost.add(visitor_id)
+        else:
+            self.unique_visitors_production.add(visitor_id)
+
+    def _count_localhost_view(self, slug: str, visitor_id: str):
+        """Add a localhost view to the per-slug localhost counters."""
+        self.localhost_views_by_slug[slug] += 1
+        self.localhost_viewers_by_slug[slug].add(visitor_id)
 
     def _generate_fingerprint(self, request: VisitorTrackRequest) -> str:
         """Generate a unique fingerprint for the visitor."""
-        fingerprint_data = f"{request.user_agent}|{request.accept_language}|{request.screen_resolution}|{request.timezone}|{request.platform}"
-        return hashlib.sha256(fingerprint_data.encode()).hexdigest()[:32]
+        fingerprint_data = "|".join((
+            request.user_agent or "",
+            request.accept_language or "",
+            request.screen_resolution or "",
+            request.timezone or "",
+            request.platform or ""
+        )).encode("utf-8", "replace")
+        return hashlib.blake2b(fingerprint_data, digest_size=16).hexdigest()
 
-    async def track_visitor(self, request: VisitorTrackRequest) -> VisitorTrackResponse:
+    def track_visitor(self, request: VisitorTrackRequest) -> VisitorTrackResponse:
         """Track a new or returning visitor."""
         fingerprint = self._generate_fingerprint(request)
         now = datetime.now(timezone.utc)
+        self.version += 1
+        self._stats_cache.clear()
 
         # Check if we have an existing visitor with this fingerprint
-        existing_visitor_id = None
-        for visitor_id, visitor_data in self.visitors.items():
-            if visitor_data.get("fingerprint") == fingerprint:
-                existing_visitor_id = visitor_id
-                break
+        existing_visitor_id = self.fingerprint_index.get(fingerprint)
 
         if existing_visitor_id:
             # Returning visitor
             visitor = self.visitors[existing_visitor_id]
-            visitor["total_visits"] = (visitor.get("total_visits", 1) + 1)
-            visitor["last_visit_at"] = now
+            if visitor.total_visits == 1:
+                self.new_visitor_count -= 1
+            visitor.total_visits += 1
+            visitor.last_visit_at = now
 
             # Track session
-            if existing_visitor_id not in self.visitor_sessions:
-                self.visitor_sessions[existing_visitor_id] = []
             self.visitor_sessions[existing_visitor_id].append(now)
 
             return VisitorTrackResponse(
                 visitor_id=existing_visitor_id,
                 is_new_visitor=False,
-                total_visits=visitor["total_visits"],
+                total_visits=visitor.total_visits,
                 last_visit_at=now
             )
         else:
             # New visitor
             visitor_id = str(uuid4())
-            visitor = {
-                "id": visitor_id,
-                "fingerprint": fingerprint,
-                "user_agent": request.user_agent,
-                "accept_language": request.accept_language,
-                "screen_resolution": request.screen_resolution,
-                "timezone": request.timezone,
-                "platform": request.platform,
-                "language": request.language,
-                "referrer": request.referrer,
-                "first_visit_at": now,
-                "last_visit_at": now,
-                "total_visits": 1,
-                "is_new_visitor": True
-            }
+            visitor = Visitor(
+                id=visitor_id,
+                fingerprint=fingerprint,
+                user_agent=request.user_agent,
+                accept_language=request.accept_language,
+                screen_resolution=request.screen_resolution,
+                timezone=request.timezone,
+                platform=request.platform,
+                language=request.language,
+                referrer=request.referrer,
+                first_visit_at=now,
+                last_visit_at=now
+            )
 
             self.visitors[visitor_id] = visitor
+            self.fingerprint_index[fingerprint] = visitor_id
+            self.new_visitor_count += 1
             self.visitor_sessions[visitor_id] = [now]
 
             return VisitorTrackResponse(
@@ -85,15 +197,18 @@ class MemoryVisitorService:
                 last_visit_at=now
             )
 
-    async def track_blog_view(self, request: VisitorBlogViewRequest, is_localhost: bool = False) -> VisitorBlogViewResponse:
+    def track_blog_view(
+        self, request: VisitorBlogViewRequest, is_localhost: bool = False
+    ) -> VisitorBlogViewResponse:
         """Track a blog view by a visitor."""
-        view_id = str(uuid4())
+        view_id = f"v{self._id_counter:016x}"
+        self._id_counter += 1
         now = datetime.now(timezone.utc)
 
         # Check if visitor exists
         if request.visitor_id not in self.visitors:
             # Create visitor if doesn't exist (fallback)
-            await self.track_visitor(VisitorTrackRequest(
+            self.track_visitor(VisitorTrackRequest(
                 user_agent="unknown",
                 accept_language="unknown",
                 screen_resolution="unknown",
@@ -102,88 +217,126 @@ class MemoryVisitorService:
                 language="unknown"
             ))
 
-        # Count existing views for this blog
-        existing_views = [v for v in self.blog_views if v["blog_slug"] == request.blog_slug]
-        unique_viewers = set(v["visitor_id"] for v in existing_views)
+        # Existing views for this blog
+        slug_views = self.views_by_slug[request.blog_slug]
+        unique_viewers = self.unique_viewers_by_slug[request.blog_slug]
         is_new_view = request.visitor_id not in unique_viewers
 
         # Add new view with localhost flag
-        view = {
-            "id": view_id,
-            "visitor_id": request.visitor_id,
-            "blog_slug": request.blog_slug,
-            "blog_title": request.blog_title,
-            "viewed_at": now,
-            "is_unique_view": is_new_view,
-            "is_localhost": is_localhost
-        }
+        view = BlogView(
+            id=view_id,
+            visitor_id=request.visitor_id,
+            blog_slug=request.blog_slug,
+            blog_title=request.blog_title,
+            viewed_at=now,
+            is_unique_view=is_new_view,
+            is_localhost=is_localhost
+        )
         self.blog_views.append(view)
+        slug_views.append(view)
+        unique_viewers.add(request.visitor_id)
+        insort(self.viewed_at_by_slug[request.blog_slug], now)
+        if self.first_viewed_at is None or now < self.first_viewed_at:
+            self.first_viewed_at = now
+        if self.last_viewed_at is None or now > self.last_viewed_at:
+            self.last_viewed_at = now
+        self._count_visitor(request.visitor_id, is_localhost)
+        if is_localhost:
+            self._count_localhost_view(request.blog_slug, request.visitor_id)
+        self.version += 1
+        self._blog_views_cache.pop(request.blog_slug)
+        self._stats_cache.clear()
 
         return VisitorBlogViewResponse(
             view_id=view_id,
             is_new_view=is_new_view,
-            total_blog_views=len(existing_views) + 1
+            total_blog_views=len(slug_views),
+            unique_blog_views=len(unique_viewers)
         )
 
-    async def get_visitor_stats(self) -> VisitorStatsResponse:
+    def get_visitor_stats(self) -> VisitorStatsResponse:
         """Get visitor statistics."""
+        cached = self._stats_cache.get("stats")
+        if cached is not None:
+            return cached
+
         total_visitors = len(self.visitors)
-        new_visitors = len([v for v in self.visitors.values() if v.get("total_visits", 1) == 1])
+        new_visitors = self.new_visitor_count
         returning_visitors = total_visitors - new_visitors
 
-        # Blog view stats
-        blog_views_by_slug = {}
-        for view in self.blog_views:
-            slug = view["blog_slug"]
-            if slug not in blog_views_by_slug:
-                blog_views_by_slug[slug] = {"count": 0, "unique_viewers": set(), "title": view["blog_title"]}
-            blog_views_by_slug[slug]["count"] += 1
-            blog_views_by_slug[slug]["unique_viewers"].add(view["visitor_id"])
-
         # Top blog posts
         top_blog_posts = []
-        for slug, data in sorted(blog_views_by_slug.items(), key=lambda x: x[1]["count"], reverse=True)[:10]:
+        most_viewed = heapq.nlargest(
+            10, self.views_by_slug.items(), key=lambda x: len(x[1])
+        )
+        for slug, views in most_viewed:
             top_blog_posts.append({
                 "slug": slug,
-                "title": data["title"],
-                "view_count": data["count"],
-                "unique_viewers": len(data["unique_viewers"])
+                "title": views[0].blog_title,
+                "view_count": len(views),
+                "unique_viewers": len(self.unique_viewers_by_slug[slug])
             })
 
         # Recent visitors
         recent_visitors = []
-        for visitor_id, visitor in sorted(self.visitors.items(), key=lambda x: x[1]["last_visit_at"], reverse=True)[:10]:
+        most_recent = heapq.nlargest(
+            10, self.visitors.items(), key=lambda x: x[1].last_visit_at
+        )
+        for visitor_id, visitor in most_recent:
             recent_visitors.append({
                 "visitorId": visitor_id,
-                "isNewVisitor": visitor.get("total_visits", 1) == 1,
-                "totalVisits": visitor.get("total_visits", 1),
-                "lastVisitAt": visitor["last_visit_at"].isoformat()
+                "isNewVisitor": visitor.total_visits == 1,
+                "totalVisits": visitor.total_visits,
+                "lastVisitAt": visitor.last_visit_at.isoformat()
             })
 
-        return VisitorStatsResponse(
+        stats = VisitorStatsResponse(
             total_visitors=total_visitors,
             new_visitors=new_visitors,
             returning_visitors=returning_visitors,
             total_blog_views=len(self.blog_views),
-            unique_blog_views=sum(len(data["unique_viewers"]) for data in blog_views_by_slug.values()),
+            unique_blog_views=sum(
+                len(viewers) for viewers in self.unique_viewers_by_slug.values()
+            ),
             top_blog_posts=top_blog_posts,
             recent_visitors=recent_visitors
         )
+        self._stats_cache.set("stats", stats)
+        return stats
 
-    async def get_blog_views(self, slug: str) -> VisitorBlogViewsResponse:
-        """Get view count for a specific blog post."""
-        blog_views = [v for v in self.blog_views if v["blog_slug"] == slug]
-        unique_viewers = set(v["visitor_id"] for v in blog_views)
-        recent_views = len([v for v in blog_views if (datetime.now(timezone.utc) - v["viewed_at"]).days <= 7])
-        last_viewed_at = max(v["viewed_at"] for v in blog_views) if blog_views else None
+    def _blog_views(self, slug: str) -> VisitorBlogViewsResponse:
+        """Build (or reuse the cached) view counts for a blog post."""
+        cached = self._blog_views_cache.get(slug)
+        if cached is not None:
+            return cached
+
+        blog_views = self.views_by_slug.get(slug, [])
+
+        # A view is recent while less than 8 whole days old, bisect the sorted times
+        viewed_at = self.viewed_at_by_slug.get(slug, [])
+        cutoff = datetime.now(timezone.utc) - timedelta(days=8)
+        recent_views = len(viewed_at) - bisect_right(viewed_at, cutoff)
+        last_viewed_at = viewed_at[-1] if viewed_at else None
 
-        return VisitorBlogViewsResponse(
+        views = VisitorBlogViewsResponse(
             slug=slug,
             total_views=len(blog_views),
-            unique_views=len(unique_viewers),
+            unique_views=len(self.unique_viewers_by_slug.get(slug, ())),
             recent_views=recent_views,
             last_viewed_at=last_viewed_at
         )
+        self._blog_views_cache.set(slug, views)
+        return views
+
+    def get_blog_views(self, slug: str) -> VisitorBlogViewsResponse:
+        """Get view count for a specific blog post."""
+        return self._blog_views(slug)
+
+    def get_blog_views_bulk(
+        self, slugs: List[str]
+    ) -> Dict[str, VisitorBlogViewsResponse]:
+        """Get view counts for several blog posts at once."""
+        return {slug: self._blog_views(slug) for slug in set(slugs)}
 
 
 # Global service instance
@@ -7,14 +7,18 @@ Clean and manage localhost views from production analytics data.
 import sys
 import os
 import json
+import heapq
+from dataclasses import asdict
 from datetime import datetime, timedelta
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, List, Tuple
 from pathlib import Path
 
+import orjson
+
 # Add the parent directory to the path to import app modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from app.services.visitor_service import visitor_service
+from app.services.visitor_service import BlogView, visitor_service
 
 
 class Colors:
@@ -33,97 +37,97 @@ class Colors:
 class AnalyticsManager:
     """Interactive analytics management system"""
 
+    # Color prefixes for the print helpers, built once
+    _HEADER = Colors.BOLD + Colors.CYAN
+    _HEADER_RULE = _HEADER + '=' * 60 + Colors.RESET
+    _SECTION = Colors.BOLD + Colors.BLUE + "--- "
+    _SUCCESS = Colors.GREEN + "✅ "
+    _WARNING = Colors.YELLOW + "⚠️  "
+    _ERROR = Colors.RED + "❌ "
+    _INFO = Colors.CYAN + "ℹ️  "
+
     def __init__(self):
-        self.original_data = None
-        self.backup_data = None
+        self.removed_views = None
+        # (visitor_service.version, stats) of the last overview
+        self._overview_cache = None
 
     def print_header(self, title: str):
         """Print a formatted header"""
-        print(f"\n{Colors.BOLD}{Colors.CYAN}{'='*60}{Colors.RESET}")
-        print(f"{Colors.BOLD}{Colors.CYAN}{title:^60}{Colors.RESET}")
-        print(f"{Colors.BOLD}{Colors.CYAN}{'='*60}{Colors.RESET}")
+        print("\n" + self._HEADER_RULE)
+        print(f"{self._HEADER}{title:^60}{Colors.RESET}")
+        print(self._HEADER_RULE)
 
     def print_section(self, title: str):
         """Print a section header"""
-        print(f"\n{Colors.BOLD}{Colors.BLUE}--- {title} ---{Colors.RESET}")
+        print("\n" + self._SECTION + title + " ---" + Colors.RESET)
 
     def print_success(self, message: str):
         """Print success message"""
-        print(f"{Colors.GREEN}✅ {message}{Colors.RESET}")
+        print(self._SUCCESS + message + Colors.RESET)
 
     def print_warning(self, message: str):
         """Print warning message"""
-        print(f"{Colors.YELLOW}⚠️  {message}{Colors.RESET}")
+        print(self._WARNING + message + Colors.RESET)
 
     def print_error(self, message: str):
         """Print error message"""
-        print(f"{Colors.RED}❌ {message}{Colors.RESET}")
+        print(self._ERROR + message + Colors.RESET)
 
     def print_info(self, message: str):
         """Print info message"""
-        print(f"{Colors.CYAN}ℹ️  {message}{Colors.RESET}")
+        print(self._INFO + message + Colors.RESET)
 
     def get_analytics_overview(self) -> Dict:
         """Get comprehensive analytics overview"""
+        cached = self._overview_cache
+        if cached is not None and cached[0] == visitor_service.version:
+            return cached[1]
 
         total_views = len(visitor_service.blog_views)
-        localhost_views = [v for v in visitor_service.blog_views if v.get("is_localhost", False)]
-        production_views = [v for v in visitor_service.blog_views if not v.get("is_localhost", False)]
-
-        # Get unique visitors
-        all_visitors = set(v["visitor_id"] for v in visitor_service.blog_views)
-        localhost_visitors = set(v["visitor_id"] for v in localhost_views)
-        production_visitors = set(v["visitor_id"] for v in production_views)
+        localhost_views = sum(visitor_service.localhost_views_by_slug.values())
+        production_views = total_views - localhost_views
 
-        # Group by blog slug
+        # Group by blog slug, the service keeps these counts per slug on write
         blog_stats = {}
-        for view in visitor_service.blog_views:
-            slug = view["blog_slug"]
-            if slug not in blog_stats:
-                blog_stats[slug] = {
-                    "total": 0,
-                    "localhost": 0,
-                    "production": 0,
-                    "unique_visitors": set(),
-                    "localhost_visitors": set()
-                }
-
-            blog_stats[slug]["total"] += 1
-            blog_stats[slug]["unique_visitors"].add(view["visitor_id"])
-
-            if view.get("is_localhost", False):
-                blog_stats[slug]["localhost"] += 1
-                blog_stats[slug]["localhost_visitors"].add(view["visitor_id"])
-            else:
-                blog_stats[slug]["production"] += 1
-
-        # Convert sets to counts
-        for slug in blog_stats:
-            blog_stats[slug]["unique_visitors"] = len(blog_stats[slug]["unique_visitors"])
-            blog_stats[slug]["localhost_visitors"] = len(blog_stats[slug]["localhost_visitors"])
+        for slug, views in visitor_service.views_by_slug.items():
+            slug_localhost_views = visitor_service.localhost_views_by_slug.get(slug, 0)
+            blog_stats[slug] = {
+                "total": len(views),
+                "localhost": slug_localhost_views,
+                "production": len(views) - slug_localhost_views,
+                "unique_visitors": len(visitor_service.unique_viewers_by_slug[slug]),
+                "localhost_visitors": len(
+                    visitor_service.localhost_viewers_by_slug.get(slug, ())
+                )
+            }
 
         # Time analysis
         if visitor_service.blog_views:
-            latest_view = max(v["viewed_at"] for v in visitor_service.blog_views)
-            oldest_view = min(v["viewed_at"] for v in visitor_service.blog_views)
+            latest_view = visitor_service.last_viewed_at
+            oldest_view = visitor_service.first_viewed_at
             date_range = (latest_view - oldest_view).days
         else:
             latest_view = oldest_view = None
             date_range = 0
 
-        return {
+        stats = {
             "total_views": total_views,
-            "localhost_views": len(localhost_views),
-            "production_views": len(production_views),
-            "total_visitors": len(all_visitors),
-            "localhost_visitors": len(localhost_visitors),
-            "production_visitors": len(production_visitors),
+            "localhost_views": localhost_views,
+            "production_views": production_views,
+            "total_visitors": len(visitor_service.unique_visitors_all),
+            "localhost_visitors": len(visitor_service.unique_visitors_localhost),
+            "production_visitors": len(visitor_service.unique_visitors_production),
             "blog_stats": blog_stats,
             "latest_view": latest_view,
             "oldest_view": oldest_view,
             "date_range_days": date_range,
-            "localhost_percentage": round((len(localhost_views) / total_views * 100), 2) if total_views > 0 else 0
+            "localhost_percentage": (
+                round((localhost_views / total_views * 100), 2)
+                if total_views > 0 else 0
+            )
         }
+        self._overview_cache = (visitor_service.version, stats)
+        return stats
 
     def display_overview(self, stats: Dict):
         """Display comprehensive analytics overview"""
@@ -201,25 +205,49 @@ class AnalyticsManager:
         print(f"{'Production Visitors':<20} {before_stats['production_visitors']:<12,} {after_stats['production_visitors']:<12,} +{before_stats['localhost_visitors']:,}")
         print(f"{'Localhost Visitors':<20} {before_stats['localhost_visitors']:<12,} {after_stats['localhost_visitors']:<12,} -{before_stats['localhost_visitors']:,}")
 
-    def backup_data(self, stats: Dict) -> str:
+    def _partition_views(
+        self, views: List[BlogView]
+    ) -> Tuple[List[BlogView], List[BlogView]]:
+        """Split views into (production, localhost) in a single pass"""
+        keep = []
+        removed = []
+        for view in views:
+            (removed if view.is_localhost else keep).append(view)
+        return keep, removed
+
+    def backup_data(
+        self, stats: Dict, localhost_views: Iterable[BlogView] = None
+    ) -> str:
         """Create backup of current data"""
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        if localhost_views is None:
+            localhost_views = (v for v in visitor_service.blog_views if v.is_localhost)
+
+        now = datetime.now()
+        timestamp = now.strftime('%Y%m%d_%H%M%S')
         filename = f"analytics_backup_{timestamp}.json"
 
         backup_data = {
-            "backup_created": datetime.now().isoformat(),
+            "backup_created": now.isoformat(),
             "backup_reason": "localhost_views_cleanup",
             "statistics": stats,
-            "localhost_views": [v for v in visitor_service.blog_views if v.get("is_localhost", False)],
             "total_views_before": len(visitor_service.blog_views)
         }
 
-        with open(filename, 'w') as f:
-            json.dump(backup_data, f, indent=2, default=str)
+        # Write the views one by one instead of building the whole document in memory
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(backup_data, default=str)[:-1])
+            f.write(b',"localhost_views":[')
+            for i, view in enumerate(localhost_views):
+                if i:
+                    f.write(b',')
+                f.write(orjson.dumps(view, default=str))
+            f.write(b']}')
 
         return filename
 
-    def cleanup_localhost_views(self, create_backup: bool = True) -> Tuple[bool, Dict, Dict]:
+    def cleanup_localhost_views(
+        self, create_backup: bool = True
+    ) -> Tuple[bool, Dict, Dict]:
         """Perform actual cleanup of localhost views"""
 
         # Get before stats
@@ -228,19 +256,20 @@ class AnalyticsManager:
         if before_stats['localhost_views'] == 0:
             return False, before_stats, before_stats
 
+        keep, removed = self._partition_views(visitor_service.blog_views)
+
         # Create backup if requested
         backup_file = None
         if create_backup:
-            backup_file = self.backup_data(before_stats)
+            backup_file = self.backup_data(before_stats, removed)
             self.print_info(f"Backup created: {backup_file}")
 
-        # Store original data for potential restore
-        self.original_data = visitor_service.blog_views.copy()
+        # Keep only the removed views for a potential restore
+        self.removed_views = removed
 
         # Remove localhost views
-        original_count = len(visitor_service.blog_views)
-        visitor_service.blog_views = [v for v in visitor_service.blog_views if not v.get("is_localhost", False)]
-        removed_count = original_count - len(visitor_service.blog_views)
+        visitor_service.blog_views = keep
+        visitor_service.rebuild_indexes()
 
         # Get after stats
         after_stats = self.get_analytics_overview()
@@ -249,21 +278,27 @@ class AnalyticsManager:
 
     def restore_data(self) -> bool:
         """Restore data from backup"""
-        if self.original_data is None:
+        if self.removed_views is None:
             self.print_error("No backup data available to restore")
             return False
 
-        visitor_service.blog_views = self.original_data.copy()
+        # Merge the removed views back in viewed_at order, keeping views tracked since
+        visitor_service.blog_views = list(heapq.merge(
+            visitor_service.blog_views, self.removed_views, key=lambda v: v.viewed_at
+        ))
+        self.removed_views = None
+        visitor_service.rebuild_indexes()
         self.print_success("Data restored from backup")
         return True
 
     def export_detailed_report(self, stats: Dict) -> str:
         """Export detailed analytics report"""
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        now = datetime.now()
+        timestamp = now.strftime('%Y%m%d_%H%M%S')
         filename = f"analytics_report_{timestamp}.json"
 
         report = {
-            "report_generated": datetime.now().isoformat(),
+            "report_generated": now.isoformat(),
             "report_type": "analytics_overview",
             "summary": {
                 "total_views": stats["total_views"],
@@ -282,12 +317,12 @@ class AnalyticsManager:
             },
             "localhost_views_detail": [
                 {
-                    "id": v["id"],
-                    "blog_slug": v["blog_slug"],
-                    "viewed_at": v["viewed_at"].isoformat(),
-                    "visitor_id": v["visitor_id"]
+                    "id": v.id,
+                    "blog_slug": v.blog_slug,
+                    "viewed_at": v.viewed_at.isoformat(),
+                    "visitor_id": v.visitor_id
                 }
-                for v in visitor_service.blog_views if v.get("is_localhost", False)
+                for v in visitor_service.blog_views if v.is_localhost
             ]
         }
 
@@ -401,6 +436,7 @@ class AnalyticsManager:
                 confirm = input(f"\n{Colors.RED}Type 'DELETE ALL' to confirm: {Colors.RESET}").strip()
                 if confirm == 'DELETE ALL':
                     visitor_service.blog_views.clear()
+                    visitor_service.rebuild_indexes()
                     self.print_success("All data cleared!")
                 else:
                     self.print_error("Operation cancelled")
@@ -408,7 +444,8 @@ class AnalyticsManager:
             elif choice == '2':
                 self.print_section("📋 Raw Data Structure")
                 if visitor_service.blog_views:
-                    print(json.dumps(visitor_service.blog_views[:2], indent=2, default=str))
+                    sample = [asdict(v) for v in visitor_service.blog_views[:2]]
+                    print(json.dumps(sample, indent=2, default=str))
                     if len(visitor_service.blog_views) > 2:
                         print(f"\n... and {len(visitor_service.blog_views) - 2} more entries")
                 else:
@@ -416,10 +453,19 @@ class AnalyticsManager:
 
             elif choice == '3':
                 pattern = input("Enter search pattern (blog slug): ").strip()
-                matches = [v for v in visitor_service.blog_views if pattern.lower() in v["blog_slug"].lower()]
+                # Lowercase each distinct slug once rather than once per view
+                pattern_lower = pattern.lower()
+                matching_slugs = {
+                    slug for slug in visitor_service.views_by_slug
+                    if pattern_lower in slug.lower()
+                }
+                matches = [
+                    v for v in visitor_service.blog_views
+                    if v.blog_slug in matching_slugs
+                ]
                 print(f"\nFound {len(matches)} matching views:")
                 for view in matches[:5]:
-                    print(f"  {view['blog_slug']} - {view['viewed_at']}")
+                    print(f"  {view.blog_slug} - {view.viewed_at}")
                 if len(matches) > 5:
                     print(f"  ... and {len(matches) - 5} more")
 
@@ -1 +1,5 @@
-# Test suite
\ No newline at end of file
+# Test suite
+import pytest
+
+# Keep detailed assertion messages in the shared helpers
+pytest.register_assert_rewrite("tests._helpers")
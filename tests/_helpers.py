@@ -0,0 +1,45 @@
+import orjson
+
+from app.schemas.visitors import VisitorBlogViewRequest, VisitorTrackRequest
+
+
+def assert_ok(response, status=200, data_has=(), data_equals=None, body=None):
+    """Assert a successful ApiResponse envelope and return its data.
+
+    data_equals maps data keys to their expected values. Pass body when the
+    response was already parsed, so it is not decoded twice.
+    """
+    assert response.status_code == status
+    if body is None:
+        body = orjson.loads(response.content)
+    assert body["success"] is True
+    assert isinstance(body["data"], dict)
+    for key in data_has:
+        assert key in body["data"]
+    for key, value in (data_equals or {}).items():
+        assert body["data"][key] == value
+    return body["data"]
+
+
+def track_visitor(service, user_agent="test-agent"):
+    """Track a visitor on a visitor service and return its id.
+
+    The fingerprint comes from the request fields, so vary user_agent to get
+    distinct visitors.
+    """
+    return service.track_visitor(VisitorTrackRequest(
+        user_agent=user_agent,
+        accept_language="en-US",
+        screen_resolution="1920x1080",
+        timezone="UTC",
+        platform="Linux",
+        language="en"
+    )).visitor_id
+
+
+def track_view(service, visitor_id, slug="post", is_localhost=False):
+    """Track a view of slug by visitor_id on a visitor service."""
+    request = VisitorBlogViewRequest(
+        visitor_id=visitor_id, blog_slug=slug, blog_title=slug
+    )
+    return service.track_blog_view(request, is_localhost=is_localhost)
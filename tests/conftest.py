@@ -1,42 +1,121 @@
 import pytest
+import pytest_asyncio
 import asyncio
+import importlib.util
+import orjson
+from types import MappingProxyType
 from fastapi.testclient import TestClient
+from httpx import AsyncClient, ASGITransport
 from app.main import app
 # from app.core.database import db  # TODO: uncomment when database is implemented
 
+# uvloop ships with uvicorn[standard]; fall back to the stdlib loop without it
+_USE_UVLOOP = importlib.util.find_spec("uvloop") is not None
+
+# Request payloads shared by the fixtures, built once at import
+_VISITOR_PAYLOAD = {
+    "user_agent": "Mozilla/5.0 (Test Browser)",
+    "accept_language": "en-US,en;q=0.9",
+    "screen_resolution": "1920x1080",
+    "timezone": "America/New_York",
+    "platform": "Web",
+    "language": "en",
+    "referrer": "https://google.com"
+}
+
+_SESSION_HEADERS = {
+    "X-Session-ID": "test-session-123",
+    "X-Screen-Resolution": _VISITOR_PAYLOAD["screen_resolution"],
+    "X-Timezone": _VISITOR_PAYLOAD["timezone"],
+    "X-Platform": _VISITOR_PAYLOAD["platform"],
+    "X-User-Agent": _VISITOR_PAYLOAD["user_agent"],
+    "X-Referrer": _VISITOR_PAYLOAD["referrer"]
+}
+
+# Read-only so no test can change it for the rest of the session
+_SAMPLE_HEALTH_RESPONSE = MappingProxyType({
+    "success": True,
+    "data": MappingProxyType({
+        "status": "healthy",
+        "timestamp": "2024-01-01T00:00:00.000000",
+        "version": "1.0.0",
+        "environment": "test"
+    })
+})
+
 
 @pytest.fixture(scope="session")
 def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
+    """Create and install one event loop for the test session."""
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
     yield loop
     loop.close()
+    # Don't leave a closed loop installed for teardown code that looks it up
+    asyncio.set_event_loop(None)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client():
-    """Create a test client for the FastAPI app."""
-    return TestClient(app)
+    """Create a test client for the FastAPI app, shared by the whole session.
+
+    This is the only place tests construct a client. Entering it runs the app
+    lifespan once for the session instead of never.
+    """
+    backend_options = {"use_uvloop": _USE_UVLOOP}
+    with TestClient(app, backend="asyncio", backend_options=backend_options) as c:
+        yield c
+
+
+@pytest_asyncio.fixture(scope="session")
+async def aclient():
+    """Async client on the in-process ASGI app, for concurrent requests."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+@pytest.fixture(scope="session")
+def health_response(client):
+    """Response and parsed body of GET /api/v1/health, fetched once per session."""
+    response = client.get("/api/v1/health")
+    return response, orjson.loads(response.content)
+
+
+@pytest.fixture(scope="session")
+def detailed_health_response(client):
+    """Response and parsed body of GET /api/v1/health/detailed, fetched once."""
+    response = client.get("/api/v1/health/detailed")
+    return response, orjson.loads(response.content)
+
+
+@pytest.fixture(scope="session")
+def cors_probe(client):
+    """GET /api/v1/health with an allowed Origin, sent once per session."""
+    return client.get("/api/v1/health", headers={"Origin": "https://remcostoeten.nl"})
+
+
+@pytest.fixture(scope="session")
+def tracked_visitor(client):
+    """A visitor tracked once per session.
+
+    Returns its response, parsed body and the session headers to send with it.
+    """
+    response = client.post("/api/v1/visitors/track", json=_VISITOR_PAYLOAD)
+    return response, orjson.loads(response.content), _SESSION_HEADERS
 
 
 @pytest.fixture(scope="session", autouse=True)
-async def setup_database():
+def setup_database():
     """Setup database for tests."""
-    # TODO: Set up test database when implemented
+    # TODO: Set up test database when implemented, named per xdist worker
+    # (os.environ.get("PYTEST_XDIST_WORKER", "gw0")) so parallel runs don't share it
     # For now, we'll skip database operations
     yield
     # TODO: Cleanup test database when implemented
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_health_response():
     """Sample health response for testing."""
-    return {
-        "success": True,
-        "data": {
-            "status": "healthy",
-            "timestamp": "2024-01-01T00:00:00.000000",
-            "version": "1.0.0",
-            "environment": "test"
-        }
-    }
\ No newline at end of file
+    return _SAMPLE_HEALTH_RESPONSE
\ No newline at end of file
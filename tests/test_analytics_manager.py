@@ -0,0 +1,54 @@
+import pytest
+
+from app.services.visitor_service import MemoryVisitorService
+from scripts import analytics_manager
+from scripts.analytics_manager import AnalyticsManager
+from tests._helpers import track_view, track_visitor
+
+
+@pytest.fixture
+def service(monkeypatch):
+    service = MemoryVisitorService()
+    monkeypatch.setattr(analytics_manager, "visitor_service", service)
+    return service
+
+
+def _track(service, slug, is_localhost):
+    visitor_id = track_visitor(service, user_agent=f"agent-{slug}-{is_localhost}")
+    track_view(service, visitor_id, slug=slug, is_localhost=is_localhost)
+
+
+@pytest.fixture
+def manager(service):
+    _track(service, "a", is_localhost=False)
+    _track(service, "a", is_localhost=True)
+    _track(service, "b", is_localhost=True)
+    _track(service, "b", is_localhost=False)
+    return AnalyticsManager()
+
+
+def test_cleanup_removes_localhost_views_and_rebuilds_indexes(service, manager):
+    cleaned, before, after = manager.cleanup_localhost_views(create_backup=False)
+
+    assert cleaned
+    assert before["localhost_views"] == 2
+    assert after["total_views"] == 2
+    assert after["localhost_views"] == 0
+    assert after["localhost_visitors"] == 0
+    assert all(not view.is_localhost for view in service.blog_views)
+    assert service.get_blog_views("a").total_views == 1
+    assert service.get_blog_views("b").unique_views == 1
+
+
+def test_restore_merges_views_back_in_order(service, manager):
+    original = list(service.blog_views)
+    manager.cleanup_localhost_views(create_backup=False)
+    _track(service, "c", is_localhost=False)
+
+    assert manager.restore_data()
+    assert service.blog_views == original + [service.views_by_slug["c"][0]]
+    viewed_at = [view.viewed_at for view in service.blog_views]
+    assert viewed_at == sorted(viewed_at)
+    assert service.get_blog_views("a").total_views == 2
+    assert manager.get_analytics_overview()["localhost_views"] == 2
+    assert not manager.restore_data()
@@ -0,0 +1,137 @@
+import asyncio
+
+import pytest
+
+from app.core.batch_writer import AsyncBatchWriter
+
+
+class RecordingFlush:
+    """Flush callback that records batches and fails the first `failures` calls."""
+
+    def __init__(self, failures=0):
+        self.batches = []
+        self.failures = failures
+
+    async def __call__(self, batch):
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("store unavailable")
+        self.batches.append(list(batch))
+
+
+async def test_coalesces_up_to_max_batch_size():
+    flush = RecordingFlush()
+    writer = AsyncBatchWriter(flush, max_batch_size=3, max_delay=10)
+    writer.start()
+    for i in range(7):
+        writer.put(i)
+    await writer.stop()
+    assert flush.batches == [[0, 1, 2], [3, 4, 5], [6]]
+
+
+async def test_coalesces_within_max_delay():
+    flush = RecordingFlush()
+    writer = AsyncBatchWriter(flush, max_batch_size=100, max_delay=0.05)
+    writer.start()
+    writer.put(1)
+    writer.put(2)
+    await asyncio.sleep(0.2)
+    writer.put(3)
+    await asyncio.sleep(0.2)
+    assert flush.batches == [[1, 2], [3]]
+    await writer.stop()
+
+
+async def test_stop_drains_queued_items():
+    flush = RecordingFlush()
+    writer = AsyncBatchWriter(flush, max_batch_size=100, max_delay=10)
+    writer.start()
+    for i in range(5):
+        writer.put(i)
+    await writer.stop()
+    assert flush.batches == [[0, 1, 2, 3, 4]]
+    assert not writer.is_running
+
+
+class BlockingFlush(RecordingFlush):
+    """Flush callback that holds each batch until released."""
+
+    def __init__(self):
+        super().__init__()
+        self.release = asyncio.Event()
+
+    async def __call__(self, batch):
+        await self.release.wait()
+        await super().__call__(batch)
+
+
+async def test_put_is_rejected_once_stopping():
+    flush = BlockingFlush()
+    writer = AsyncBatchWriter(flush, max_delay=0)
+    writer.start()
+    writer.put(1)
+    await asyncio.sleep(0.01)
+
+    stopping = asyncio.create_task(writer.stop())
+    await asyncio.sleep(0)
+    assert not writer.is_running
+    with pytest.raises(RuntimeError):
+        writer.put(2)
+
+    flush.release.set()
+    await stopping
+    assert flush.batches == [[1]]
+    with pytest.raises(RuntimeError):
+        writer.put(3)
+
+
+async def test_stop_flushes_items_queued_behind_the_sentinel():
+    flush = BlockingFlush()
+    writer = AsyncBatchWriter(flush, max_delay=0)
+    writer.start()
+    writer.put(1)
+    await asyncio.sleep(0.01)
+
+    stopping = asyncio.create_task(writer.stop())
+    await asyncio.sleep(0)
+    writer._queue.put_nowait(2)
+
+    flush.release.set()
+    await stopping
+    assert flush.batches == [[1], [2]]
+
+
+async def test_failed_flush_is_retried():
+    flush = RecordingFlush(failures=2)
+    writer = AsyncBatchWriter(flush, max_delay=0, max_retries=3, retry_delay=0)
+    writer.start()
+    writer.put("a")
+    await writer.stop()
+    assert flush.batches == [["a"]]
+
+
+async def test_failed_batch_carries_over_to_next_flush():
+    flush = RecordingFlush(failures=2)
+    writer = AsyncBatchWriter(flush, max_delay=0, max_retries=2, retry_delay=0)
+    writer.start()
+    writer.put("a")
+    await asyncio.sleep(0.05)
+    assert flush.batches == []
+    writer.put("b")
+    await writer.stop()
+    assert flush.batches == [["a", "b"]]
+
+
+async def test_pending_writes_are_capped(caplog):
+    flush = RecordingFlush(failures=2)
+    writer = AsyncBatchWriter(
+        flush, max_batch_size=3, max_delay=10,
+        max_retries=1, retry_delay=0, max_pending=4
+    )
+    writer.start()
+    for i in range(6):
+        writer.put(i)
+    await writer.stop()
+    # [0, 1, 2] failed, then [0..5] failed and lost the two oldest writes
+    assert flush.batches == [[2, 3, 4, 5]]
+    assert "Dropping 2 queued writes" in caplog.text
@@ -0,0 +1,21 @@
+import orjson
+
+from app.services.visitor_service import visitor_service
+
+
+def test_unhandled_error_keeps_cors_headers(client, monkeypatch):
+    """Unexpected errors return the ApiError envelope with CORS headers intact."""
+    def fail():
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(visitor_service, "get_visitor_stats", fail)
+    response = client.get(
+        "/api/v1/visitors/stats", headers={"Origin": "https://remcostoeten.nl"}
+    )
+
+    assert response.status_code == 500
+    body = orjson.loads(response.content)
+    assert body["success"] is False
+    assert body["error"] == "boom"
+    assert body["code"] == "internal_error"
+    assert response.headers["access-control-allow-origin"] == "https://remcostoeten.nl"
@@ -1,36 +1,29 @@
 import pytest
-from fastapi.testclient import TestClient
 
+from tests._helpers import assert_ok
 
-def test_health_check_basic(client: TestClient):
-    """Test basic health check endpoint."""
-    response = client.get("/api/v1/health")
+_HEALTH_FIELDS = ("status", "timestamp", "version", "environment")
 
-    assert response.status_code == 200
-    data = response.json()
 
-    assert data["success"] is True
-    assert "data" in data
-    assert data["data"]["status"] == "healthy"
-    assert "timestamp" in data["data"]
-    assert data["data"]["version"] == "1.0.0"
-    assert data["data"]["environment"] in ["development", "test", "production"]
+def test_health_check_basic(health_response):
+    """Test basic health check endpoint."""
+    response, body = health_response
+    data = assert_ok(response, data_has=_HEALTH_FIELDS, body=body)
 
+    assert data["status"] == "healthy"
+    assert data["version"] == "1.0.0"
+    assert data["environment"] in ["development", "test", "production"]
 
-def test_health_check_detailed(client: TestClient):
-    """Test detailed health check endpoint."""
-    response = client.get("/api/v1/health/detailed")
 
-    assert response.status_code == 200
-    data = response.json()
+def test_health_check_detailed(detailed_health_response):
+    """Test detailed health check endpoint."""
+    response, body = detailed_health_response
+    data = assert_ok(response, data_has=("status", "features"), body=body)
 
-    assert data["success"] is True
-    assert "data" in data
-    assert data["data"]["status"] == "healthy"
-    assert "features" in data["data"]
+    assert data["status"] == "healthy"
 
     # Check feature flags
-    features = data["data"]["features"]
+    features = data["features"]
     assert "analytics" in features
     assert "feedback" in features
     assert "production_only_views" in features
@@ -39,35 +32,24 @@ def test_health_check_detailed(client: TestClient):
     assert isinstance(features["production_only_views"], bool)
 
 
-def test_health_check_response_structure(client: TestClient):
+def test_health_check_response_structure(health_response):
     """Test that health check response has the correct structure."""
-    response = client.get("/api/v1/health")
-    data = response.json()
-
-    # Required top-level fields
-    assert "success" in data
-    assert "data" in data
-    assert isinstance(data["success"], bool)
-    assert isinstance(data["data"], dict)
+    response, body = health_response
 
-    # Required data fields
-    required_fields = ["status", "timestamp", "version", "environment"]
-    for field in required_fields:
-        assert field in data["data"]
+    # Envelope and required data fields
+    data = assert_ok(response, data_has=_HEALTH_FIELDS, body=body)
 
     # Status should be healthy
-    assert data["data"]["status"] == "healthy"
+    assert data["status"] == "healthy"
 
     # Version should be a string
-    assert isinstance(data["data"]["version"], str)
+    assert isinstance(data["version"], str)
 
     # Environment should be a string
-    assert isinstance(data["data"]["environment"], str)
+    assert isinstance(data["environment"], str)
 
 
-def test_health_check_cors_headers(client: TestClient):
+def test_health_check_cors_headers(cors_probe):
     """Test that CORS headers are properly set."""
-    response = client.get("/api/v1/health", headers={"Origin": "https://remcostoeten.nl"})
-
     # Should have CORS headers when Origin is present
-    assert "access-control-allow-origin" in response.headers
\ No newline at end of file
+    assert "access-control-allow-origin" in cors_probe.headers
\ No newline at end of file
@@ -0,0 +1,88 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fakeredis import FakeAsyncRedis
+
+from app.schemas.pageviews import PageviewRequest
+from app.services import pageview_service as pageview_module
+from app.services.pageview_service import MemoryPageviewService, RedisPageviewService
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    fake = FakeAsyncRedis(decode_responses=True)
+    monkeypatch.setattr(pageview_module, "get_redis", lambda: fake)
+    return fake
+
+
+def _pageview(url, title=None, days_ago=0):
+    timestamp = datetime.now(timezone.utc) - timedelta(days=days_ago)
+    return PageviewRequest(url=url, title=title, timestamp=timestamp)
+
+
+@pytest.fixture
+def pageviews():
+    """Pageviews dated relative to the test's own clock, not collection time."""
+    return (
+        _pageview("/a", days_ago=0),
+        _pageview("/a", title="Page A", days_ago=0),
+        _pageview("/b", title="Page B", days_ago=1),
+        _pageview("/a", title="Page A", days_ago=3),
+        _pageview("/c", title="Page C", days_ago=20),
+    )
+
+
+async def _track_all(service, pageviews):
+    for request in pageviews:
+        await service.track_pageview(request)
+
+
+async def test_redis_stats_without_running_writer(redis, pageviews):
+    service = RedisPageviewService()
+    assert not service.writer.is_running
+    await _track_all(service, pageviews)
+
+    stats = await service.get_pageview_stats()
+    assert stats.total == 5
+    assert stats.today == 2
+    assert stats.yesterday == 1
+    assert stats.this_week == 4
+    assert stats.unique_urls == 3
+    assert stats.top_pages[0] == {"url": "/a", "count": 3, "title": None}
+    assert [page["url"] for page in stats.top_pages] == ["/a", "/b", "/c"]
+
+
+async def test_redis_stats_through_batch_writer(redis, pageviews):
+    service = RedisPageviewService()
+    service.writer.start()
+    await _track_all(service, pageviews)
+    await service.writer.stop()
+
+    stats = await service.get_pageview_stats()
+    assert stats.total == 5
+    assert stats.this_week == 4
+
+
+async def test_redis_day_keys_expire(redis, pageviews):
+    service = RedisPageviewService()
+    await _track_all(service, pageviews)
+
+    day_keys = [key async for key in redis.scan_iter(f"{service.DAY_KEY_PREFIX}*")]
+    assert len(day_keys) == 4
+    max_ttl = int(service.DAY_KEY_TTL.total_seconds())
+    for key in day_keys:
+        assert 0 < await redis.ttl(key) <= max_ttl
+
+
+async def test_redis_matches_memory_service(redis, pageviews):
+    redis_service = RedisPageviewService()
+    memory_service = MemoryPageviewService()
+    # A client clock running ahead lands in today for both backends
+    pageviews += (_pageview("/d", title="Page D", days_ago=-2),)
+    await _track_all(redis_service, pageviews)
+    await _track_all(memory_service, pageviews)
+
+    redis_stats = await redis_service.get_pageview_stats()
+    memory_stats = await memory_service.get_pageview_stats()
+    assert redis_stats.today == 3
+    assert redis_stats.model_dump() == memory_stats.model_dump()
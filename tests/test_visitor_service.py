@@ -0,0 +1,73 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.services.visitor_service import MemoryVisitorService
+from tests._helpers import track_view, track_visitor
+
+
+@pytest.fixture
+def service():
+    return MemoryVisitorService()
+
+
+def test_blog_view_invalidates_cached_blog_views(service):
+    visitor_id = track_visitor(service)
+    assert service.get_blog_views("post").total_views == 0
+
+    track_view(service, visitor_id)
+    views = service.get_blog_views("post")
+    assert views.total_views == 1
+    assert views.unique_views == 1
+    assert views.recent_views == 1
+    assert service.get_blog_views_bulk(["post"])["post"].total_views == 1
+
+
+def test_tracking_invalidates_cached_visitor_stats(service):
+    visitor_id = track_visitor(service)
+    assert service.get_visitor_stats().total_blog_views == 0
+
+    track_view(service, visitor_id)
+    stats = service.get_visitor_stats()
+    assert stats.total_blog_views == 1
+    assert stats.top_blog_posts[0]["slug"] == "post"
+
+    track_visitor(service, user_agent="other-agent")
+    assert service.get_visitor_stats().total_visitors == 2
+
+
+def test_returning_fingerprint_reuses_the_visitor(service):
+    visitor_id = track_visitor(service)
+    stats = service.get_visitor_stats()
+    assert (stats.total_visitors, stats.new_visitors) == (1, 1)
+
+    assert track_visitor(service) == visitor_id
+    stats = service.get_visitor_stats()
+    assert stats.total_visitors == 1
+    assert stats.new_visitors == 0
+    assert stats.returning_visitors == 1
+    fingerprint = service.visitors[visitor_id].fingerprint
+    assert service.fingerprint_index == {fingerprint: visitor_id}
+
+    # The maintained counters match a rebuild from the stored visitors
+    new_visitor_count = service.new_visitor_count
+    service.rebuild_indexes()
+    assert service.new_visitor_count == new_visitor_count
+    assert service.fingerprint_index == {fingerprint: visitor_id}
+
+
+@pytest.mark.parametrize("days_ago,is_recent", [(7.99, True), (8.01, False)])
+def test_recent_views_cutoff_is_eight_days(service, days_ago, is_recent):
+    visitor_id = track_visitor(service)
+    track_view(service, visitor_id)
+    track_view(service, visitor_id)
+
+    # Backdate one view; it is recent while viewed_at is under 8 whole days old
+    viewed_at = datetime.now(timezone.utc) - timedelta(days=days_ago)
+    service.blog_views[0].viewed_at = viewed_at
+    assert ((datetime.now(timezone.utc) - viewed_at).days <= 7) is is_recent
+    service.rebuild_indexes()
+
+    views = service.get_blog_views("post")
+    assert views.total_views == 2
+    assert views.recent_views == (2 if is_recent else 1)